@@ -7,29 +7,94 @@ from . import primitives
 from .synthesis.api import *
 from .primitives import list_primitives
 from .computational_backends.api import *
-from . import tests
 from .utils.time_utils import *
 from .utils.cli_utils import show_info
 from .version import __version__
-import featuretools.demo
-import featuretools.wrappers
 from . import feature_base
 from .feature_base import AggregationFeature, DirectFeature, Feature, FeatureBase, IdentityFeature, TransformFeature, GroupByTransformFeature, save_features, load_features
 
-import pkg_resources
+import importlib.util
 import sys
-# Call functions registered by other libraries when featuretools is imported
-for entry_point in pkg_resources.iter_entry_points('featuretools_initialize'):
-    try:
-        method = entry_point.load()
-        if callable(method):
-            method()
-    except Exception:
-        pass
-
-# Load in submodules registered by other libraries into Featuretools namespace
-for entry_point in pkg_resources.iter_entry_points('featuretools_plugin'):
-    try:
-        sys.modules["featuretools." + entry_point.name] = entry_point.load()
-    except Exception:
-        pass
+from .utils.entry_point import group_entry_points
+
+_plugins_loaded = False
+
+
+def _load_plugins():
+    # Entry points registered by other libraries are only discovered the
+    # first time they could be needed, since scanning every installed
+    # distribution is slow and most sessions do not use any plugins
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    _plugins_loaded = True
+    entry_points = group_entry_points('featuretools_initialize', 'featuretools_plugin')
+
+    # Call functions registered by other libraries when featuretools is initialized
+    for entry_point in entry_points['featuretools_initialize']:
+        try:
+            method = entry_point.load()
+            if callable(method):
+                method()
+        except Exception:
+            pass
+
+    # Load in submodules registered by other libraries into Featuretools namespace
+    for entry_point in entry_points['featuretools_plugin']:
+        try:
+            sys.modules["featuretools." + entry_point.name] = entry_point.load()
+        except Exception:
+            pass
+
+
+class _PluginFinder(object):
+    # Module __getattr__ is not consulted for `import featuretools.<plugin>`,
+    # so plugins are also loaded when the import system cannot find a
+    # featuretools submodule. The finder is appended to sys.meta_path, so
+    # real submodules are always found first.
+    @classmethod
+    def find_spec(cls, fullname, path, target=None):
+        if _plugins_loaded or fullname.count('.') != 1 or not fullname.startswith('featuretools.'):
+            return None
+        _load_plugins()
+        if fullname not in sys.modules:
+            return None
+        return importlib.util.spec_from_loader(fullname, cls)
+
+    @staticmethod
+    def create_module(spec):
+        module = sys.modules[spec.name]
+        spec.loader_state = getattr(module, '__spec__', None)
+        return module
+
+    @staticmethod
+    def exec_module(module):
+        # the plugin is already imported, only restore its original spec
+        module.__spec__ = module.__spec__.loader_state
+
+
+sys.meta_path.append(_PluginFinder)
+
+
+# Submodules that are not needed to build or calculate features are only
+# imported the first time they are accessed
+_LAZY_SUBMODULES = ('demo', 'tests', 'wrappers')
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        import importlib
+        return importlib.import_module("featuretools." + name)
+    if not name.startswith('__'):
+        _load_plugins()
+        if "featuretools." + name in sys.modules:
+            return sys.modules["featuretools." + name]
+    raise AttributeError("module 'featuretools' has no attribute '%s'" % name)
+
+
+# module level __getattr__ is only supported on Python 3.7+
+if sys.version_info < (3, 7):
+    import featuretools.demo
+    import featuretools.tests
+    import featuretools.wrappers
+    _load_plugins()
@@ -1,9 +1,9 @@
 import click
 import pandas as pd
-import pkg_resources
 
 import featuretools
 from featuretools.utils.cli_utils import print_info
+from featuretools.utils.entry_point import entry_points
 
 
 @click.group()
@@ -25,7 +25,7 @@ def list_primitives():
 cli.add_command(list_primitives)
 cli.add_command(info)
 
-for entry_point in pkg_resources.iter_entry_points('featuretools_cli'):
+for entry_point in entry_points(group='featuretools_cli'):
     try:
         loaded = entry_point.load()
         if hasattr(loaded, 'commands'):
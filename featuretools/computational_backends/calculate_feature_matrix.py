@@ -10,6 +10,7 @@ import cloudpickle
 import numpy as np
 import pandas as pd
 
+import featuretools
 from featuretools.computational_backends.feature_set import FeatureSet
 from featuretools.computational_backends.feature_set_calculator import (
     FeatureSetCalculator
@@ -122,6 +123,9 @@ def calculate_feature_matrix(features, entityset=None, cutoff_time=None, instanc
                 time_elapsed: total time in seconds that has elapsed since start of call
 
     """
+    # make sure featuretools plugins have been initialized
+    featuretools._load_plugins()
+
     assert (isinstance(features, list) and features != [] and
             all([isinstance(feature, FeatureBase) for feature in features])), \
         "features must be a non-empty list of features"
@@ -7,6 +7,7 @@ import numpy as np
 import pandas as pd
 from pandas.api.types import is_dtype_equal, is_numeric_dtype
 
+import featuretools
 import featuretools.variable_types.variable as vtypes
 from featuretools.entityset import deserialize, serialize
 from featuretools.entityset.entity import Entity
@@ -59,6 +60,9 @@ class EntitySet(object):
 
                     ft.EntitySet("my-entity-set", entities, relationships)
         """
+        # make sure featuretools plugins have been initialized
+        featuretools._load_plugins()
+
         self.id = id
         self.entity_dict = {}
         self.relationships = []
@@ -2,6 +2,7 @@ import json
 
 import boto3
 
+import featuretools
 from featuretools.entityset.deserialize import \
     description_to_entityset as deserialize_es
 from featuretools.feature_base.feature_base import (
@@ -62,6 +63,9 @@ def load_features(features, profile_name=None):
     .. seealso::
         :func:`.save_features`
     """
+    # make sure featuretools plugins have been initialized
+    featuretools._load_plugins()
+
     return FeaturesDeserializer.load(features, profile_name).to_list()
 
 
@@ -1,7 +1,7 @@
 # flake8: noqa
 from .api import *
 
-import pkg_resources
+from featuretools.utils.entry_point import entry_points
 # Load in a list of primitives registered by other libraries into Featuretools
 # Example entry_points definition for a library using this entry point:
 #    entry_points={
@@ -9,7 +9,7 @@ import pkg_resources
 #            other_library = other_library:LIST_OF_PRIMITIVES
 #        ]
 #    }
-for entry_point in pkg_resources.iter_entry_points('featuretools_primitives'):
+for entry_point in entry_points(group='featuretools_primitives'):
     try:
         loaded = entry_point.load()
         for primitive in loaded:
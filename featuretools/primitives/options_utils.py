@@ -1,21 +1,10 @@
+import sys
 import warnings
 
 from featuretools import primitives
 from featuretools.feature_base import IdentityFeature
 
 
-def _get_primitive_options():
-    # all possible option keys: function that verifies value type
-    return {'ignore_entities': list_entity_check,
-            'include_entities': list_entity_check,
-            'ignore_variables': dict_to_list_variable_check,
-            'include_variables': dict_to_list_variable_check,
-            'ignore_groupby_entities': list_entity_check,
-            'include_groupby_entities': list_entity_check,
-            'ignore_groupby_variables': dict_to_list_variable_check,
-            'include_groupby_variables': dict_to_list_variable_check}
-
-
 def dict_to_list_variable_check(option, es):
     if not (isinstance(option, dict) and
             all([isinstance(option_val, list) for option_val in option.values()])):
@@ -36,19 +25,35 @@ def list_entity_check(option, es):
         return False
     else:
         for invalid_entity in [entity for entity in option if entity not in es]:
-            print(invalid_entity)
             warnings.warn("Entity '%s' not in entityset" % (invalid_entity))
         return True
 
 
+# all possible option keys: function that verifies value type
+_PRIMITIVE_OPTIONS = {'ignore_entities': list_entity_check,
+                      'include_entities': list_entity_check,
+                      'ignore_variables': dict_to_list_variable_check,
+                      'include_variables': dict_to_list_variable_check,
+                      'ignore_groupby_entities': list_entity_check,
+                      'include_groupby_entities': list_entity_check,
+                      'ignore_groupby_variables': dict_to_list_variable_check,
+                      'include_groupby_variables': dict_to_list_variable_check}
+
+
 def generate_all_primitive_options(all_primitives,
                                    primitive_options,
                                    ignore_entities,
                                    ignore_variables,
                                    es):
-    entityset_dict = {entity.id: [variable.id for variable in entity.variables]
-                      for entity in es.entities}
-    primitive_options = _init_primitive_options(primitive_options, entityset_dict)
+    if primitive_options:
+        # store variable ids as sets so option validation can check membership
+        # without scanning every variable of the entity
+        entityset_dict = {entity.id: {variable.id for variable in entity.variables}
+                          for entity in es.entities}
+        primitive_options = _init_primitive_options(primitive_options, entityset_dict)
+    else:
+        # the entityset is only needed to validate user supplied options
+        primitive_options = {}
     global_ignore_entities = ignore_entities
     # for now, only use primitive names as option keys
     for primitive in all_primitives:
@@ -57,26 +62,22 @@ def generate_all_primitive_options(all_primitives,
         if primitive in primitive_options:
             # Reconcile global options with individually-specified options
             options = primitive_options[primitive]
-            included_entities = set().union(*[set().union(
-                option.get('include_entities') if option.get('include_entities') else set([]),
-                option.get('include_variables').keys() if option.get('include_variables') else set([]))
-                for option in options])
+            included_entities = set()
+            for option in options:
+                included_entities.update(option.get('include_entities', ()))
+                included_entities.update(option.get('include_variables', ()))
             global_ignore_entities = global_ignore_entities.difference(included_entities)
+            extra_ignore_entities = ignore_entities.difference(included_entities)
             for option in options:
-                option['ignore_entities'] = option['ignore_entities'].union(
-                    ignore_entities.difference(included_entities)
-                )
-            for entity, ignore_vars in ignore_variables.items():
-                # if already ignoring variables for this entity, add globals
-                for option in options:
-                    if entity in option['ignore_variables']:
-                        option['ignore_variables'][entity] = option['ignore_variables'][entity].union(ignore_vars)
-                    # if no ignore_variables and entity is explicitly included, don't ignore the variable
-                    elif entity in included_entities:
-                        continue
-                    # Otherwise, keep the global option
-                    else:
-                        option['ignore_variables'][entity] = ignore_vars
+                option['ignore_entities'] = option['ignore_entities'] | extra_ignore_entities
+                option_ignore_variables = option['ignore_variables']
+                for entity, ignore_vars in ignore_variables.items():
+                    # if already ignoring variables for this entity, add globals
+                    if entity in option_ignore_variables:
+                        option_ignore_variables[entity] = option_ignore_variables[entity] | ignore_vars
+                    # Otherwise, keep the global option unless the entity is explicitly included
+                    elif entity not in included_entities:
+                        option_ignore_variables[entity] = ignore_vars
         else:
             # no user specified options, just use global defaults
             primitive_options[primitive] = [{'ignore_entities': ignore_entities,
@@ -88,10 +89,14 @@ def _init_primitive_options(primitive_options, es):
     # Flatten all tuple keys, convert value lists into sets, check for
     # conflicting keys
     flattened_options = {}
+    primitive_dict = None
     for primitive_key, options in primitive_options.items():
         if isinstance(options, list):
-            primitive = primitives.get_aggregation_primitives().get(primitive_key) or \
-                primitives.get_transform_primitives().get(primitive_key)
+            if primitive_dict is None:
+                # searching the primitives module is slow, so only do it once
+                primitive_dict = primitives.get_transform_primitives()
+                primitive_dict.update(primitives.get_aggregation_primitives())
+            primitive = primitive_dict.get(primitive_key)
             assert len(primitive.input_types[0]) == len(options) if \
                 isinstance(primitive.input_types[0], list) else \
                 len(primitive.input_types) == len(options), \
@@ -113,95 +118,99 @@ def _init_primitive_options(primitive_options, es):
 
 def _init_option_dict(key, option_dict, es):
     initialized_option_dict = {}
-    primitive_options = _get_primitive_options()
     # verify all keys are valid and match expected type, convert lists to sets
     for option_key, option in option_dict.items():
-        if option_key not in primitive_options:
+        if option_key not in _PRIMITIVE_OPTIONS:
             raise KeyError("Unrecognized primitive option \'%s\' for %s" %
                            (option_key, key))
-        if not primitive_options[option_key](option, es):
+        if not _PRIMITIVE_OPTIONS[option_key](option, es):
             raise TypeError("Incorrect type formatting for \'%s\' for %s" %
                             (option_key, key))
+        # user supplied keys (e.g. parsed from a config file) may be distinct
+        # string objects; interning them lets the option lookups made during
+        # DFS match the literal keys by identity
+        option_key = sys.intern(option_key)
+        # option values are never updated in place, only replaced when global
+        # options are merged in, so they can be frozen
         if isinstance(option, list):
-            initialized_option_dict[option_key] = set(option)
+            initialized_option_dict[option_key] = frozenset(option)
         elif isinstance(option, dict):
-            initialized_option_dict[option_key] = {key: set(option[key]) for key in option}
+            initialized_option_dict[option_key] = {key: frozenset(option[key]) for key in option}
     # initialize ignore_entities and ignore_variables to empty sets if not present
     if 'ignore_variables' not in initialized_option_dict:
         initialized_option_dict['ignore_variables'] = {}
     if 'ignore_entities' not in initialized_option_dict:
-        initialized_option_dict['ignore_entities'] = set([])
+        initialized_option_dict['ignore_entities'] = frozenset()
     return initialized_option_dict
 
 
+def _feature_key(f):
+    # the option filters only look at where a feature comes from, so each
+    # feature is reduced to (entity id, variable id) once, with a variable id
+    # of None for anything that is not an identity feature
+    if isinstance(f, IdentityFeature):
+        return f.entity.id, f.variable.id
+    return f.entity.id, None
+
+
 def _variable_filter_generator(options):
-    def passes_ignore_filter(f):
-        return (not isinstance(f, IdentityFeature) or
-                f.entity.id not in options['ignore_variables'] or
-                f.variable.id not in options['ignore_variables'][f.entity.id])
-
-    def passes_include_filter(f):
-        return (not isinstance(f, IdentityFeature) or
-                (f.entity.id in options['include_variables'] and
-                 f.variable.id in options['include_variables'][f.entity.id]))
-
-    if 'include_variables' in options:
-        def variable_filter(f):
-            return passes_include_filter(f) or \
-                (f.entity.id not in options['include_variables'] and
-                    passes_ignore_filter(f))
-    # ignore options initialized to set() if not present
-    else:
-        def variable_filter(f):
-            return passes_ignore_filter(f)
+    ignore_variables = options.get('ignore_variables', {})
+    include_variables = options.get('include_variables')
+
+    def variable_filter(feature_key):
+        entity_id, variable_id = feature_key
+        if variable_id is None:
+            return True
+        # include_variables takes precedence over ignore_variables for an entity
+        if include_variables is not None:
+            included = include_variables.get(entity_id)
+            if included is not None:
+                return variable_id in included
+        ignored = ignore_variables.get(entity_id)
+        return ignored is None or variable_id not in ignored
     return variable_filter
 
 
 def _groupby_filter_generator(options):
-    def passes_include_groupby_filter(f):
-        return (isinstance(f, IdentityFeature) and
-                (f.entity.id in options['include_groupby_variables'] and
-                 f.variable.id in options['include_groupby_variables'][f.entity.id]))
-
-    def passes_ignore_groupby_filter(f):
-        return (isinstance(f, IdentityFeature) and (
-                f.entity.id not in options['ignore_groupby_variables'] or
-                (f.entity.id in options['ignore_groupby_variables'] and
-                    f.variable.id not in options['ignore_groupby_variables'][f.entity.id])))
-
-    if 'include_groupby_variables' in options and 'ignore_groupby_variables' in options:
-        def groupby_filter(f):
-            return passes_include_groupby_filter(f) or \
-                (f.entity.id not in options['include_groupby_variables'] and
-                    passes_ignore_groupby_filter(f))
-    elif 'include_groupby_variables' in options:
-        def groupby_filter(f):
-            return passes_include_groupby_filter(f) or \
-                f.entity.id not in options['include_groupby_variables']
-    elif 'ignore_groupby_variables' in options:
-        def groupby_filter(f):
-            return passes_ignore_groupby_filter(f)
-    else:
-        def groupby_filter(f):
-            return (isinstance(f, IdentityFeature))
+    ignore_groupby_variables = options.get('ignore_groupby_variables')
+    include_groupby_variables = options.get('include_groupby_variables')
+
+    def groupby_filter(feature_key):
+        entity_id, variable_id = feature_key
+        if include_groupby_variables is not None:
+            included = include_groupby_variables.get(entity_id)
+            if included is not None:
+                return variable_id is not None and variable_id in included
+            # entities not mentioned in include_groupby_variables are only
+            # restricted further if ignore_groupby_variables is also given
+            if ignore_groupby_variables is None:
+                return True
+        if variable_id is None:
+            return False
+        ignored = ignore_groupby_variables.get(entity_id) if \
+            ignore_groupby_variables is not None else None
+        return ignored is None or variable_id not in ignored
     return groupby_filter
 
 
 def ignore_entity_for_primitive(options, entity, groupby=False):
     # This logic handles whether given options ignore an entity or not
+    entity_id = entity.id
+
     def should_ignore_entity(option):
-        if 'include_entities' in option and \
-                entity.id not in option['include_entities'] or \
-                groupby and 'include_groupby_entities' in option and \
-                entity.id not in option['include_groupby_entities']:
-            return True
-        elif entity.id in option['ignore_entities'] or \
-                groupby and 'ignore_groupby_entities' in option and \
-                entity.id in option['ignore_groupby_entities']:
-            return True
-        else:
-            return False
-    return any([should_ignore_entity(option) for option in options])
+        return (('include_entities' in option and
+                 entity_id not in option['include_entities']) or
+                entity_id in option['ignore_entities'])
+
+    if groupby:
+        def should_ignore_groupby_entity(option):
+            return (should_ignore_entity(option) or
+                    ('include_groupby_entities' in option and
+                     entity_id not in option['include_groupby_entities']) or
+                    ('ignore_groupby_entities' in option and
+                     entity_id in option['ignore_groupby_entities']))
+        return any(should_ignore_groupby_entity(option) for option in options)
+    return any(should_ignore_entity(option) for option in options)
 
 
 def filter_groupby_matches_by_options(groupby_matches, options):
@@ -210,26 +219,42 @@ def filter_groupby_matches_by_options(groupby_matches, options):
                                      groupby=True)
 
 
+def _filters_variables(option):
+    return bool(option.get('ignore_variables') or option.get('include_variables'))
+
+
 def filter_matches_by_options(matches, options, groupby=False):
+    # Without any variable options every match is valid, which is the case
+    # for all primitives when dfs is called without ignore_variables or
+    # primitive_options. Groupbys still have to be identity features.
+    if not groupby and not any(_filters_variables(option) for option in options):
+        return set(matches)
     generator = _groupby_filter_generator if groupby else _variable_filter_generator
+    # run each filter once per distinct feature, then drop the matches that contain a rejected one
     # If more than one option, than need to handle each for each input
     if len(options) > 1:
-        def is_valid_match(match):
-            variable_filter = [generator(option) for option in options]
-            if all([vf(m) for vf, m in zip(variable_filter, match)]):
-                return True
-            else:
-                return False
-    else:
-        def is_valid_match(match):
-            variable_filter = generator(options[0])
-            if all([variable_filter(f) for f in match]):
-                return True
-            else:
-                return False
+        rejected = []
+        for option, position_features in zip(options, zip(*matches)):
+            feature_filter = generator(option)
+            features = {id(f): f for f in position_features}
+            rejected.append({feature_id for feature_id, f in features.items()
+                             if not feature_filter(_feature_key(f))})
+        if not any(rejected):
+            return set(matches)
+        return _drop_rejected(matches,
+                              lambda match: any(map(set.__contains__, rejected, map(id, match))))
+
+    feature_filter = generator(options[0])
+    features = {id(f): f for match in matches for f in match}
+    rejected = {feature_id for feature_id, f in features.items()
+                if not feature_filter(_feature_key(f))}
+    if not rejected:
+        return set(matches)
+    return _drop_rejected(matches, lambda match: not rejected.isdisjoint(map(id, match)))
+
 
-    valid_matches = set()
-    for match in matches:
-        if is_valid_match(match):
-            valid_matches.add(match)
-    return valid_matches
+def _drop_rejected(matches, is_rejected):
+    # taking the difference of a set reuses the stored hashes of the kept matches
+    if isinstance(matches, (set, frozenset)):
+        return matches.difference(match for match in matches if is_rejected(match))
+    return {match for match in matches if not is_rejected(match)}
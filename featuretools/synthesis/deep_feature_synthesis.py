@@ -1,6 +1,7 @@
 import logging
 from collections import defaultdict
 
+import featuretools
 from featuretools import primitives, variable_types
 from featuretools.entityset.relationship import RelationshipPath
 from featuretools.feature_base import (
@@ -136,6 +137,9 @@ class DeepFeatureSynthesis(object):
                  drop_exact=None,
                  where_stacking_limit=1):
 
+        # make sure featuretools plugins have been initialized
+        featuretools._load_plugins()
+
         if target_entity_id not in entityset.entity_dict:
             es_name = entityset.id or 'entity set'
             msg = 'Provided target entity %s does not exist in %s' % (target_entity_id, es_name)
@@ -1,7 +1,15 @@
+import sys
+from types import ModuleType
+
 import pandas as pd
 import pytest
 
+import featuretools
 from featuretools import dfs
+from featuretools.utils.entry_point import (
+    _registered_entry_points,
+    group_entry_points
+)
 
 
 class MockEntryPoint(object):
@@ -21,11 +29,11 @@ class MockEntryPoint(object):
         return self
 
 
-class MockPkgResources(object):
+class MockEntryPoints(object):
     def __init__(self, entry_point):
         self.entry_point = entry_point
 
-    def iter_entry_points(self, name):
+    def __call__(self, group):
         return [self.entry_point]
 
 
@@ -34,8 +42,8 @@ def test_entry_point(es, monkeypatch):
     # overrides a module used in the entry_point decorator for dfs
     # so the decorator will use this mock entry point
     monkeypatch.setitem(dfs.__globals__['entry_point'].__globals__,
-                        "pkg_resources",
-                        MockPkgResources(entry_point))
+                        "_registered_entry_points",
+                        MockEntryPoints(entry_point))
     fm, fl = dfs(entityset=es, target_entity='customers')
     assert "entityset" in entry_point.kwargs.keys()
     assert "target_entity" in entry_point.kwargs.keys()
@@ -45,8 +53,8 @@ def test_entry_point(es, monkeypatch):
 def test_entry_point_error(es, monkeypatch):
     entry_point = MockEntryPoint()
     monkeypatch.setitem(dfs.__globals__['entry_point'].__globals__,
-                        "pkg_resources",
-                        MockPkgResources(entry_point))
+                        "_registered_entry_points",
+                        MockEntryPoints(entry_point))
     with pytest.raises(KeyError):
         dfs(entityset=es, target_entity='missing_entity')
 
@@ -68,11 +76,101 @@ def test_entry_point_detect_arg(monkeypatch):
     relationships = [("cards", "id", "transactions", "card_id")]
     entry_point = MockEntryPoint()
     monkeypatch.setitem(dfs.__globals__['entry_point'].__globals__,
-                        "pkg_resources",
-                        MockPkgResources(entry_point))
+                        "_registered_entry_points",
+                        MockEntryPoints(entry_point))
     fm, fl = dfs(entities,
                  relationships,
                  target_entity='cards')
     assert "entities" in entry_point.kwargs.keys()
     assert "relationships" in entry_point.kwargs.keys()
     assert "target_entity" in entry_point.kwargs.keys()
+
+
+def test_registered_entry_points_cached(monkeypatch):
+    entry_point = MockEntryPoint()
+    lookups = []
+
+    def mock_entry_points(group):
+        lookups.append(group)
+        return [entry_point]
+
+    monkeypatch.setitem(dfs.__globals__['entry_point'].__globals__,
+                        "entry_points",
+                        mock_entry_points)
+    _registered_entry_points.cache_clear()
+    try:
+        assert _registered_entry_points('mock_group') == (entry_point,)
+        assert _registered_entry_points('mock_group') == (entry_point,)
+        assert lookups == ['mock_group']
+    finally:
+        _registered_entry_points.cache_clear()
+
+
+def test_group_entry_points(monkeypatch):
+    class MockGroupedEntryPoint(MockEntryPoint):
+        def __init__(self, group):
+            self.group = group
+
+    initialize = MockGroupedEntryPoint('featuretools_initialize')
+    plugin = MockGroupedEntryPoint('featuretools_plugin')
+    other = MockGroupedEntryPoint('other_group')
+    monkeypatch.setitem(group_entry_points.__globals__,
+                        "entry_points",
+                        lambda: [initialize, other, plugin])
+    grouped = group_entry_points('featuretools_initialize', 'featuretools_plugin', 'missing')
+    assert grouped == {'featuretools_initialize': [initialize],
+                       'featuretools_plugin': [plugin],
+                       'missing': []}
+    assert group_entry_points() == {}
+
+
+@pytest.fixture
+def mock_plugins(monkeypatch):
+    plugin_module = ModuleType('mock_plugin')
+    initialize_calls = []
+
+    class MockPluginEntryPoint(object):
+        name = 'mock_plugin'
+
+        def load(self):
+            return plugin_module
+
+    class MockInitializeEntryPoint(object):
+        def load(self):
+            return lambda: initialize_calls.append(True)
+
+    def mock_group_entry_points(*groups):
+        return {'featuretools_initialize': [MockInitializeEntryPoint()],
+                'featuretools_plugin': [MockPluginEntryPoint()]}
+
+    monkeypatch.setattr(featuretools, '_plugins_loaded', False)
+    monkeypatch.setattr(featuretools, 'group_entry_points', mock_group_entry_points)
+    yield plugin_module, initialize_calls
+    sys.modules.pop('featuretools.mock_plugin', None)
+    featuretools.__dict__.pop('mock_plugin', None)
+
+
+def test_plugins_load_lazily(mock_plugins):
+    plugin_module, initialize_calls = mock_plugins
+    assert initialize_calls == []
+    assert featuretools.mock_plugin is plugin_module
+    assert initialize_calls == [True]
+    with pytest.raises(AttributeError):
+        featuretools.missing_plugin
+    assert initialize_calls == [True]
+
+
+def test_plugin_submodule_import(mock_plugins):
+    plugin_module, initialize_calls = mock_plugins
+    import featuretools.mock_plugin
+    assert sys.modules['featuretools.mock_plugin'] is plugin_module
+    assert plugin_module.__spec__ is None
+    assert initialize_calls == [True]
+    with pytest.raises(ImportError):
+        import featuretools.missing_plugin  # noqa: F401
+
+
+def test_plugins_initialized_by_entityset(mock_plugins):
+    plugin_module, initialize_calls = mock_plugins
+    featuretools.EntitySet('plugins')
+    assert initialize_calls == [True]
@@ -5,8 +5,6 @@ import struct
 import subprocess
 import sys
 
-import pkg_resources
-
 import featuretools
 
 deps = ["numpy", "pandas", "tqdm", "PyYAML", "cloudpickle",
@@ -76,6 +74,8 @@ def get_sys_info():
 
 
 def get_installed_packages():
+    import pkg_resources
+
     installed_packages = {}
     for d in pkg_resources.working_set:
         installed_packages[d.project_name] = d.version
@@ -1,8 +1,57 @@
+import sys
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from inspect import signature
 
-import pkg_resources
+import featuretools
+
+if sys.version_info >= (3, 10):
+    from importlib.metadata import entry_points
+elif sys.version_info >= (3, 6):
+    from importlib_metadata import entry_points
+else:
+    # no importlib_metadata release that can select entry points by group
+    # supports Python 3.5, so fall back to pkg_resources there
+    import pkg_resources
+
+    def entry_points(group):
+        return pkg_resources.iter_entry_points(group)
+
+
+@lru_cache(maxsize=None)
+def _registered_entry_points(group):
+    """Look up the entry points registered for ``group`` once, instead of
+    scanning the installed distributions on every decorated call."""
+    return tuple(entry_points(group=group))
+
+
+def group_entry_points(*groups):
+    """Collect the entry points registered for each of ``groups`` while
+    only scanning the installed distributions once.
+
+    Returns:
+        dict: Maps each group name to a list of its entry points.
+    """
+    grouped = {group: [] for group in groups}
+    if not grouped:
+        return grouped
+    try:
+        if sys.version_info < (3, 6):
+            # pkg_resources caches the working set, so separate lookups are cheap
+            for group in groups:
+                grouped[group] = list(entry_points(group=group))
+            return grouped
+        all_entry_points = entry_points()
+        if hasattr(all_entry_points, 'select'):
+            for group in groups:
+                grouped[group] = list(all_entry_points.select(group=group))
+        else:
+            for ep in all_entry_points:
+                if ep.group in grouped:
+                    grouped[ep.group].append(ep)
+    except Exception:
+        pass
+    return grouped
 
 
 def entry_point(name):
@@ -16,14 +65,17 @@ def entry_point(name):
             for arg, parameter in zip(args, sig.parameters):
                 on_call_kwargs[parameter] = arg
 
+            # make sure featuretools plugins have been initialized
+            featuretools._load_plugins()
+
             # collect and initialize all registered entry points
-            entry_points = []
-            for entry_point in pkg_resources.iter_entry_points(name):
+            loaded_entry_points = []
+            for entry_point in _registered_entry_points(name):
                 entry_point = entry_point.load()
-                entry_points.append(entry_point())
+                loaded_entry_points.append(entry_point())
 
             # send arguments before function is called
-            for ep in entry_points:
+            for ep in loaded_entry_points:
                 ep.on_call(on_call_kwargs)
 
             try:
@@ -34,13 +86,13 @@ def entry_point(name):
             except Exception as e:
                 runtime = time.time() - start
                 # send error
-                for ep in entry_points:
+                for ep in loaded_entry_points:
                     ep.on_error(error=e,
                                 runtime=runtime)
                 raise e
 
             # send return value
-            for ep in entry_points:
+            for ep in loaded_entry_points:
                 ep.on_return(return_value=return_value,
                              runtime=runtime)
 